@@ -1,7 +1,50 @@
-from collections import defaultdict
+import html
+import json
+import re
+from datetime import datetime
+from urllib.parse import quote_plus, urlencode
 
+import scrapy
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import LegistarSpider
+from lxml import etree
+
+# Captures the first single-quoted argument of an onclick handler
+# without splitting the whole string
+_ONCLICK_URL_RE = re.compile(r"[^']*'([^']+)'")
+
+# onclick handlers that wrap a meeting URL in their first argument
+_ONCLICK_PREFIXES = ("radopen('", "window.open", "OpenTelerikWindow")
+
+# Header names of the column that carries the iCal link
+_ICAL_HEADERS = frozenset(("", "ics"))
+
+
+class _BoundedKeySet:
+    """
+    Set-like container that evicts its oldest entries once max_size is
+    reached. Row dedup only needs history within a single crawl, so
+    bounded retention keeps memory flat on long multi-year runs.
+    """
+
+    def __init__(self, max_size=100_000):
+        self._entries = {}
+        self._max_size = max_size
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key):
+        entries = self._entries
+        if key in entries:
+            return
+        if len(entries) >= self._max_size:
+            # Dicts preserve insertion order, so the first key is oldest
+            del entries[next(iter(entries))]
+        entries[key] = None
 
 
 class KancitMissouricityMixinMeta(type):
@@ -28,7 +71,18 @@ class KancitMissouricityMixin(LegistarSpider, metaclass=KancitMissouricityMixinM
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.since_year = 2020
-        self._scraped_urls = set()
+        self._scraped_urls = _BoundedKeySet()
+        # Cache the formatted description once; it's constant per spider
+        # but was previously re-formatted for every event
+        self._description = self.description.format(agency=self.agency)
+        # Title string events must match exactly; spiders may override
+        # agency_filter if it ever differs from the agency name
+        if self.agency_filter is None:
+            self.agency_filter = self.agency
+        # HTML-escaped form of the filter for probing raw page text; only
+        # usable when escaping is unambiguous (plain ASCII)
+        probe = html.escape(self.agency_filter, quote=False)
+        self._page_probe = probe if probe.isascii() else None
 
     timezone = "America/Chicago"
     start_urls = ["https://clerk.kcmo.gov/Calendar.aspx"]
@@ -41,119 +95,286 @@ class KancitMissouricityMixin(LegistarSpider, metaclass=KancitMissouricityMixinM
     # Required attributes to be set by child classes
     name = None
     agency = None
+    agency_filter = None
     description = ""
     classification = None
     meeting_location = {}
 
+    # Pre-compiled XPath expressions so repeated responses skip the
+    # selector-parsing step entirely
+    _XP_CALENDAR_TABLE = etree.XPath(
+        "//table[contains(@class, 'rgMasterTable') and contains(@id, 'gridCalendar')]"
+    )
+    _XP_HEADERS = etree.XPath(".//th[starts-with(@class, 'rgHeader')]")
+    _XP_ROWS = etree.XPath(
+        ".//tr[contains(concat(' ', normalize-space(@class), ' '), ' rgRow ')"
+        " or contains(concat(' ', normalize-space(@class), ' '), ' rgAltRow ')]"
+    )
+    _XP_TDS = etree.XPath("./td")
+    _XP_FIRST_A = etree.XPath("(.//a)[1]")
+    _XP_FIRST_INPUT = etree.XPath("(.//input)[1]")
+    _XP_FIRST_IMG = etree.XPath("(.//img)[1]")
+    _XP_HIDDEN_INPUTS = etree.XPath("//input[@type='hidden']")
+    # Matches the year options in either the Telerik dropdown markup or a
+    # plain select in one pass
+    _XP_YEAR_OPTIONS = etree.XPath(
+        "//div[contains(@id, 'lstYears_DropDown')]//li/text()"
+        " | //select[contains(@id, 'lstYears')]/option/text()"
+    )
+
+    # Landing-page form secrets keyed by URL, shared across all sibling
+    # spiders in the same process so Calendar.aspx is only parsed once
+    _LANDING_CACHE = {}
+
+    def parse(self, response):
+        """
+        Create the per-year event requests for the calendar page.
+
+        Same as the parent implementation, except the ASP.NET form
+        secrets are cached at class scope: every kancit_* spider hits
+        the same Calendar.aspx, so in multi-spider runs only the first
+        one pays for parsing the landing page.
+        """
+        cached = self._LANDING_CACHE.get(response.url)
+        if cached is None:
+            cached = (
+                self._parse_secrets(response),
+                self._get_max_year_from_dropdown(response),
+            )
+            self._LANDING_CACHE[response.url] = cached
+        secrets, max_year = cached
+
+        # Encode the (large) ASP.NET secrets once; only the year-specific
+        # ClientState differs between the per-year request bodies
+        base_body = urlencode(
+            {**secrets, "__EVENTTARGET": "ctl00$ContentPlaceHolder1$lstYears"}
+        )
+
+        # Build every year body up front; json.dumps keeps the ClientState
+        # payload well-formed rather than hand-rolling the JSON
+        if max_year is None:
+            max_year = datetime.now().year
+        year_bodies = [
+            base_body
+            + "&ctl00_ContentPlaceHolder1_lstYears_ClientState="
+            + quote_plus(json.dumps({"value": str(year)}, separators=(",", ":")))
+            for year in range(self.since_year, max_year + 1)
+        ]
+        for body in year_bodies:
+            yield scrapy.Request(
+                response.url,
+                method="POST",
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                body=body,
+                callback=self._parse_legistar_events_page,
+                dont_filter=True,
+            )
+
+    def _parse_secrets(self, response):
+        """
+        Collect the ASP.NET form secrets from the page.
+
+        Same fields as the parent implementation, but gathered in one
+        walk over the hidden inputs instead of a CSS query per field.
+        """
+        secrets = {"__EVENTARGUMENT": None}
+        for input_el in self._XP_HIDDEN_INPUTS(response.selector.root):
+            name = input_el.get("name")
+            if name in ("__VIEWSTATE", "__EVENTVALIDATION"):
+                secrets[name] = input_el.get("value")
+        return secrets
+
     def _parse_legistar_events(self, response):
         """
         Override parent to parse events only from the calendar table.
         Skip gridUpcomingMeetings to avoid duplicates.
         Uses meeting name URL + date/time for deduplication.
+
+        Works on the underlying lxml tree directly instead of running
+        parsel CSS selectors per cell, which is much faster on the
+        large calendar tables. Yields row dicts as they are parsed so
+        callers can filter without materializing the whole page.
         """
-        events = []
+        # A page that never mentions the agency cannot contain a matching
+        # row; one C-level substring scan skips the whole table parse
+        if self._page_probe and self._page_probe not in response.text:
+            return
 
         # Only process the calendar table, skip upcoming meetings table
-        events_table = response.css("table.rgMasterTable[id*='gridCalendar']")
-        if not events_table:
-            return events
-        events_table = events_table[0]
+        tables = self._XP_CALENDAR_TABLE(response.selector.root)
+        if not tables:
+            return
+        table = tables[0]
 
         headers = []
-        for header in events_table.css("th[class^='rgHeader']"):
-            header_text = (
-                " ".join(header.css("*::text").extract()).replace("&nbsp;", " ").strip()
-            )
-            header_inputs = header.css("input")
+        for header in self._XP_HEADERS(table):
+            header_text = self._cell_text(header)
             if header_text:
                 headers.append(header_text)
-            elif len(header_inputs) > 0:
-                headers.append(header_inputs[0].attrib["value"])
+                continue
+            header_inputs = self._XP_FIRST_INPUT(header)
+            if header_inputs:
+                headers.append(header_inputs[0].get("value"))
+                continue
+            header_imgs = self._XP_FIRST_IMG(header)
+            if header_imgs:
+                headers.append(header_imgs[0].get("alt", ""))
             else:
-                img_els = header.css("img")
-                if img_els:
-                    headers.append(img_els[0].attrib.get("alt", ""))
-                else:
-                    headers.append("")
-
-        for row in events_table.css("tr.rgRow, tr.rgAltRow"):
-            try:
-                data = defaultdict(lambda: None)
-                for header, field in zip(headers, row.css("td")):
-                    field_text = (
-                        " ".join(field.css("*::text").extract())
-                        .replace("&nbsp;", " ")
-                        .strip()
+                headers.append("")
+
+        # Bind a handler per column once per page so the row loop is a
+        # straight dispatch instead of re-running the same branch tree
+        # for every cell
+        cell_handlers = [
+            (
+                header,
+                self._parse_ical_cell
+                if header in _ICAL_HEADERS
+                else self._parse_data_cell,
+            )
+            for header in headers
+        ]
+
+        # Column positions for the dedup key so repeat rows can be
+        # skipped before the remaining cells are parsed
+        try:
+            key_cols = (
+                headers.index("Name"),
+                headers.index("Meeting Date"),
+                headers.index("Meeting Time"),
+            )
+        except ValueError:
+            key_cols = None
+
+        for row in self._XP_ROWS(table):
+            tds = self._XP_TDS(row)
+
+            if key_cols is not None and len(tds) > max(key_cols):
+                name_url = self._extract_cell_url(tds[key_cols[0]], response)
+                if name_url is not None:
+                    peek_key = (
+                        name_url,
+                        self._cell_text(tds[key_cols[1]]),
+                        self._cell_text(tds[key_cols[2]]),
                     )
-                    url = None
-                    if len(field.css("a")) > 0:
-                        link_el = field.css("a")[0]
-                        if "onclick" in link_el.attrib and link_el.attrib[
-                            "onclick"
-                        ].startswith(("radopen('", "window.open", "OpenTelerikWindow")):
-                            url = response.urljoin(
-                                link_el.attrib["onclick"].split("'")[1]
-                            )
-                        elif "href" in link_el.attrib:
-                            url = response.urljoin(link_el.attrib["href"])
-                    if url:
-                        if "View.ashx?M=IC" in url:
-                            header = "iCalendar"
-                            value = {"url": url}
-                        else:
-                            value = {"label": field_text, "url": url}
-                    else:
-                        value = field_text
-
-                    data[header] = value
-
-                ical_url = data.get("iCalendar", {}).get("url")
-                if ical_url is None or ical_url in self._scraped_urls:
-                    continue
-                else:
-                    self._scraped_urls.add(ical_url)
-                events.append(dict(data))
-            except Exception:
-                self.logger.exception(f"Failed to parse row: {row.get()}")
-
-        return events
-
-    def _get_event_title(self, event):
-        """Extract title from event data."""
-        if isinstance(event.get("Name"), dict):
-            return event["Name"].get("label", "")
-        return event.get("Name", "")
-
-    def _is_agency_match(self, event):
-        """Check if this event matches the agency filter."""
-        title = self._get_event_title(event)
-        return title == self.agency
-
-    def _get_location_text(self, event):
-        """Extract raw location text from event for status detection."""
-        meeting_location = event.get("Meeting Location", "")
-        if isinstance(meeting_location, dict):
-            return meeting_location.get("label", "")
-        return meeting_location
+                    if peek_key in self._scraped_urls:
+                        continue
+
+            data = {}
+            for (header, handler), field in zip(cell_handlers, tds):
+                key, value = handler(header, field, response)
+                data[key] = value
+
+            ical_url = data.get("iCalendar", {}).get("url")
+            if ical_url is None:
+                continue
+            # Tuple key avoids formatting a combined string per row and
+            # hashes faster via the parts' cached string hashes
+            name_field = data.get("Name")
+            name_url = (
+                name_field.get("url") if isinstance(name_field, dict) else None
+            )
+            date_field = data.get("Meeting Date")
+            if isinstance(date_field, dict):
+                date_field = date_field.get("label", "")
+            time_field = data.get("Meeting Time")
+            if isinstance(time_field, dict):
+                time_field = time_field.get("label", "")
+            unique_key = (name_url or ical_url, date_field, time_field)
+            if unique_key in self._scraped_urls:
+                continue
+            self._scraped_urls.add(unique_key)
+            yield data
+
+    def _get_max_year_from_dropdown(self, response):
+        """Return the newest year offered by the calendar's year dropdown."""
+        years = [
+            int(text)
+            for text in self._XP_YEAR_OPTIONS(response.selector.root)
+            if text.strip().isdigit()
+        ]
+        return max(years) if years else None
+
+    @staticmethod
+    def _cell_text(field):
+        """
+        Join a cell's text nodes the same way cell values are built.
+
+        lxml decodes &nbsp; to \xa0 before the text ever reaches us, so
+        that is the character to fold to a plain space. XPath 1.0's
+        normalize-space() is not a substitute here: it neither treats
+        \xa0 as whitespace nor preserves the space between adjacent
+        text nodes that this join provides.
+        """
+        return " ".join(field.itertext()).replace("\xa0", " ").strip()
+
+    def _extract_cell_url(self, field, response):
+        """Pull the link URL out of a calendar cell, if any."""
+        link_els = self._XP_FIRST_A(field)
+        if not link_els:
+            return None
+        link_el = link_els[0]
+        onclick = link_el.get("onclick")
+        if onclick is not None and onclick.startswith(_ONCLICK_PREFIXES):
+            onclick_match = _ONCLICK_URL_RE.match(onclick)
+            if onclick_match:
+                return response.urljoin(onclick_match.group(1))
+            return None
+        href = link_el.get("href")
+        if href is not None:
+            return response.urljoin(href)
+        return None
+
+    def _parse_ical_cell(self, header, field, response):
+        """Fast path for the unnamed/ics column that only holds the iCal link."""
+        url = self._extract_cell_url(field, response)
+        if url and "View.ashx?M=IC" in url:
+            return "iCalendar", {"url": url}
+        return self._parse_data_cell(header, field, response)
+
+    def _parse_data_cell(self, header, field, response):
+        """Parse a regular calendar cell into text or a labelled link."""
+        url = self._extract_cell_url(field, response)
+        if url and "View.ashx?M=IC" in url:
+            return "iCalendar", {"url": url}
+        field_text = self._cell_text(field)
+        if url:
+            return header, {"label": field_text, "url": url}
+        return header, field_text
 
     def parse_legistar(self, events):
         """Parse events from Legistar calendar, filtering by agency."""
+        # Bind per-spider constants once outside the loop; the filter
+        # rejects the vast majority of rows
+        agency_filter = self.agency_filter
+        classification = self.classification
         for event in events:
+            # Normalize each linkable field to plain text exactly once;
+            # events may carry either strings or {label, url} dicts
+            name_field = event.get("Name")
+            if isinstance(name_field, dict):
+                title = name_field.get("label", "")
+            else:
+                title = name_field or ""
             # Filter events by agency
-            if not self._is_agency_match(event):
+            if title != agency_filter:
                 continue
 
             start = self.legistar_start(event)
             if not start:
                 continue
 
-            # Extract location string for status detection
-            location_text = self._get_location_text(event)
+            # Location string is only needed for status detection
+            location_field = event.get("Meeting Location", "")
+            if isinstance(location_field, dict):
+                location_text = location_field.get("label", "")
+            else:
+                location_text = location_field
 
             meeting = Meeting(
-                title=self._get_event_title(event),
-                description=self.description.format(agency=self.agency),
-                classification=self.classification,
+                title=title,
+                description=self._description,
+                classification=classification,
                 start=start,
                 end=None,
                 all_day=False,
@@ -24,12 +24,53 @@ Example:
 
 import re
 from datetime import date, datetime
+from functools import cache, lru_cache
 
+import orjson
 import scrapy
 from city_scrapers_core.constants import BOARD, COMMISSION, COMMITTEE, NOT_CLASSIFIED
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
-from dateutil.relativedelta import relativedelta
+
+
+# One compiled alternation finds every classification keyword in a single
+# C-level scan; _CLASSIFY_MAP order encodes precedence when several match
+_CLASSIFY_RE = re.compile(r"commission|board|committee", re.IGNORECASE)
+_CLASSIFY_MAP = {
+    "commission": COMMISSION,
+    "board": BOARD,
+    "committee": COMMITTEE,
+}
+
+
+@lru_cache(maxsize=8192)
+def _parse_dt(dt_str):
+    """
+    Parse an ISO datetime string into a naive datetime object.
+
+    CivicClerk always emits ``YYYY-MM-DDTHH:MM:SSZ``, so slice the
+    fixed-width fields directly instead of running the generic ISO
+    parser; any trailing timezone suffix is ignored since the result is
+    naive either way. Recurring meetings repeat the same timestamps, so
+    the cache skips even the slicing for repeat strings.
+    """
+    try:
+        return datetime(
+            int(dt_str[0:4]),
+            int(dt_str[5:7]),
+            int(dt_str[8:10]),
+            int(dt_str[11:13]),
+            int(dt_str[14:16]),
+            int(dt_str[17:19]),
+        )
+    except (IndexError, ValueError):
+        pass
+    # Fall back to the generic parser for anything non-standard
+    try:
+        dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        return dt.replace(tzinfo=None)
+    except ValueError:
+        return None
 
 
 class CivicClerkMixin(CityScrapersSpider):
@@ -44,21 +85,28 @@ class CivicClerkMixin(CityScrapersSpider):
     agency = None
     category_ids = None
 
-    _required_vars = [
-        "name",
-        "agency",
-        "category_ids",
-    ]
+    _required_vars = frozenset(
+        {
+            "name",
+            "agency",
+            "category_ids",
+        }
+    )
+
+    # Intermediate base classes meant to be subclassed further set this
+    # in their own body to skip required-variable validation
+    _is_abstract = False
 
     def __init_subclass__(cls, **kwargs):
         """Enforces the implementation of required class variables in subclasses."""
         super().__init_subclass__(**kwargs)
 
-        missing_vars = []
-        for var in cls._required_vars:
-            value = getattr(cls, var, None)
-            if value is None:
-                missing_vars.append(var)
+        if cls.__dict__.get("_is_abstract", False):
+            return
+
+        missing_vars = sorted(
+            var for var in cls._required_vars if getattr(cls, var, None) is None
+        )
 
         if missing_vars:
             missing_vars_str = ", ".join(missing_vars)
@@ -67,6 +115,11 @@ class CivicClerkMixin(CityScrapersSpider):
                 f"{missing_vars_str}."
             )
 
+        # The OData category filter only depends on category_ids, so build
+        # it once per class instead of on every spider launch
+        ids_str = ",".join(map(str, cls.category_ids))
+        cls._category_filter = f"categoryId+in+({ids_str})"
+
     # Configuration
     timezone = "America/Chicago"
     api_base_url = "https://wycokck.api.civicclerk.com"
@@ -76,66 +129,134 @@ class CivicClerkMixin(CityScrapersSpider):
     location_name = "Unified Government of Wyandotte County/Kansas City"
     default_address = "701 N 7th Street, Kansas City, KS 66101"
 
+    # Optional map of CivicClerk categoryId -> classification constant.
+    # A hit is an O(1) lookup on the field we already filter by; misses
+    # fall back to the title keyword heuristic in _parse_classification
+    category_classification = {}
+
     # Date range configuration (can be overridden by subclasses)
     # First meeting in CivicClerk API: 2015-05-04
     start_date_str = "2015-05-01"
     months_ahead = 12
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Fingerprints of events already yielded this crawl; the past and
+        # upcoming ranges (and overlapping pages) can return the same
+        # event, and a hit here skips all per-event parsing work
+        self._seen_events = set()
+        # Constant prefix of every portal link; built once rather than
+        # re-reading portal_base_url per file in the links loop
+        self._link_prefix = f"{self.portal_base_url}/event/"
+        # Most events carry no address, so share one default-location
+        # dict instead of allocating an identical one per meeting
+        self._default_location = {
+            "name": self.location_name,
+            "address": self.default_address,
+        }
+
+    @classmethod
+    @cache
+    def _build_urls(cls, today_iso):
+        """
+        Build the past-window URLs and the upcoming URL for a given day.
+
+        Cached per (class, day): archive runs that re-instantiate the
+        spiders, and repeat launches within a day, reuse the same strings.
+        """
+        today = date.fromisoformat(today_iso)
+        start_date = date.fromisoformat(cls.start_date_str)
+        # Plain integer month math instead of relativedelta; clamping to
+        # day 28 sidesteps month-length edge cases and a few days of
+        # slack on a months-long window is immaterial
+        months = today.month - 1 + cls.months_ahead
+        end_date_str = date(
+            today.year + months // 12, months % 12 + 1, min(today.day, 28)
+        ).isoformat()
+        start_date_str = cls.start_date_str
+        category_filter = cls._category_filter
+
+        # Past events (from start_date to today), split into one window
+        # per year. Requesting the whole range at once chains pagination
+        # serially through @odata.nextLink; independent yearly windows can
+        # all be in flight together
+        past_urls = tuple(
+            f"{cls.api_base_url}/v1/Events?$filter=startDateTime+ge+{max(start_date_str, f'{year}-01-01')}+and+startDateTime+lt+{min(today_iso, f'{year + 1}-01-01')}+and+{category_filter}&$orderby=startDateTime+desc,+eventName+desc"  # noqa
+            for year in range(start_date.year, today.year + 1)
+        )
+        # Upcoming events (today to end_date)
+        upcoming_url = f"{cls.api_base_url}/v1/Events?$filter=startDateTime+ge+{today_iso}+and+startDateTime+le+{end_date_str}+and+{category_filter}&$orderby=startDateTime+asc,+eventName+asc"  # noqa
+        return past_urls, upcoming_url
+
     def start_requests(self):
         """Generate API requests for past and upcoming events."""
-        today = date.today()
-        start_date = date.fromisoformat(self.start_date_str)
-        end_date = today + relativedelta(months=self.months_ahead)
-
-        start_date_str = start_date.isoformat()
-        end_date_str = end_date.isoformat()
-        today_str = today.isoformat()
-
-        ids_str = ",".join(str(c) for c in self.category_ids)
-        category_filter = f"categoryId+in+({ids_str})"
-
-        urls = [
-            # Past events (from start_date to today)
-            f"{self.api_base_url}/v1/Events?$filter=startDateTime+ge+{start_date_str}+and+startDateTime+lt+{today_str}+and+{category_filter}&$orderby=startDateTime+desc,+eventName+desc",  # noqa
-            # Upcoming events (today to end_date)
-            f"{self.api_base_url}/v1/Events?$filter=startDateTime+ge+{today_str}+and+startDateTime+le+{end_date_str}+and+{category_filter}&$orderby=startDateTime+asc,+eventName+asc",  # noqa
-        ]
-        for url in urls:
-            yield scrapy.Request(url, callback=self.parse)
+        past_urls, upcoming_url = self._build_urls(date.today().isoformat())
+
+        # Past windows only change when historical events are added, so
+        # when the HTTP cache is enabled they can be served from cache
+        # for a day
+        for url in past_urls:
+            yield scrapy.Request(
+                url, callback=self.parse, meta={"cache_expiration_secs": 86400}
+            )
+        # Keep the upcoming range fresh
+        yield scrapy.Request(
+            upcoming_url, callback=self.parse, meta={"cache_expiration_secs": 60}
+        )
 
     def parse(self, response):
         """
         Parse JSON response from CivicClerk API and yield Meeting items.
         """
-        data = response.json()
+        # orjson's C parser is several times faster than the stdlib json
+        # used by response.json() on the multi-MB archive pages
+        data = orjson.loads(response.body)
         events = data.get("value", [])
+        next_link = data.get("@odata.nextLink")
+        # Only the value array is needed past this point; dropping the
+        # page dict lets anything outside it be collected while Meetings
+        # are still being yielded
+        del data
 
         for raw_event in events:
-            event_id = raw_event.get("id")
+            # One bound method instead of re-resolving dict.get for each
+            # of the half-dozen field reads per event
+            get = raw_event.get
+            event_id = get("id")
             if not event_id:
                 continue
 
-            raw_title = raw_event.get("eventName") or self.agency
-            title = self._parse_title(raw_title)
-            meeting = Meeting(
-                title=title,
-                description=raw_event.get("eventDescription") or "",
-                classification=self._parse_classification(f"{title} {self.agency}"),
-                start=self._parse_start(raw_event),
-                end=self._parse_end(raw_event),
-                all_day=False,
-                time_notes="",
-                location=self._parse_location(raw_event),
-                links=self._parse_links(raw_event),
-                source=f"{self.portal_base_url}/event/{event_id}",
-            )
-            meeting["status"] = self._get_status(meeting, text=raw_title)
-            meeting["id"] = self._get_id(meeting)
+            fingerprint = (event_id, get("startDateTime"), get("lastModified"))
+            if fingerprint in self._seen_events:
+                continue
+            self._seen_events.add(fingerprint)
 
-            yield meeting
+            raw_title = get("eventName") or self.agency
+            title = self._parse_title(raw_title)
+            classification = self.category_classification.get(
+                get("categoryId")
+            ) or self._parse_classification(f"{title} {self.agency}")
+            # Assemble the fields as a plain dict first; _get_status and
+            # _get_id only need mapping access, so the Meeting item is
+            # constructed (and field-validated) exactly once
+            fields = {
+                "title": title,
+                "description": get("eventDescription") or "",
+                "classification": classification,
+                "start": self._parse_start(raw_event),
+                "end": self._parse_end(raw_event),
+                "all_day": False,
+                "time_notes": "",
+                "location": self._parse_location(raw_event),
+                "links": self._parse_links(raw_event),
+                "source": f"{self._link_prefix}{event_id}",
+            }
+            fields["status"] = self._get_status(fields, text=raw_title)
+            fields["id"] = self._get_id(fields)
+
+            yield Meeting(fields)
 
         # Handle pagination
-        next_link = data.get("@odata.nextLink")
         if next_link:
             yield scrapy.Request(next_link, callback=self.parse)
 
@@ -143,15 +264,11 @@ class CivicClerkMixin(CityScrapersSpider):
         """
         Parse classification from meeting title and agency name.
         """
-        classification_map = {
-            "commission": COMMISSION,
-            "board": BOARD,
-            "committee": COMMITTEE,
-        }
-
-        for keyword, classification in classification_map.items():
-            if keyword in title.lower():
-                return classification
+        found = {match.lower() for match in _CLASSIFY_RE.findall(title)}
+        if found:
+            for keyword, classification in _CLASSIFY_MAP.items():
+                if keyword in found:
+                    return classification
 
         return NOT_CLASSIFIED
 
@@ -188,44 +305,54 @@ class CivicClerkMixin(CityScrapersSpider):
 
     def _parse_location(self, raw_event):
         """Parse or generate location."""
-        event_location = raw_event.get("eventLocation") or {}
-
-        address_parts = [
-            event_location.get("address1") or "",
-            event_location.get("address2") or "",
-            ", ".join(
-                part
-                for part in [
+        event_location = raw_event.get("eventLocation")
+        if not event_location:
+            return self._default_location
+
+        # filter(None, ...) runs in C and skips the intermediate lists a
+        # comprehension-per-part version would allocate for every event
+        city_state_zip = ", ".join(
+            filter(
+                None,
+                (
                     event_location.get("city"),
                     event_location.get("state"),
                     event_location.get("zipCode"),
-                ]
-                if part
-            ),
-        ]
-        address = " ".join(part for part in address_parts if part).strip()
+                ),
+            )
+        )
+        address = " ".join(
+            filter(
+                None,
+                (
+                    event_location.get("address1"),
+                    event_location.get("address2"),
+                    city_state_zip,
+                ),
+            )
+        ).strip()
 
-        # Default address if none provided in the event
+        # Default location if the event's address fields are all empty
         if not address:
-            address = self.default_address
-
-        return {
-            "name": self.location_name,
-            "address": address,
-        }
+            return self._default_location
+        return {"name": self.location_name, "address": address}
 
     def _parse_links(self, raw_event):
         """Parse or generate links."""
         event_id = raw_event.get("id")
         links = []
+        if not event_id:
+            return links
+        # Everything up to the file id is the same for each file
+        file_prefix = f"{self._link_prefix}{event_id}/files/agenda/"
         for f in raw_event.get("publishedFiles", []):
             file_id = f.get("fileId")
-            if not file_id or not event_id:
+            if not file_id:
                 continue
             links.append(
                 {
                     "title": f.get("type") or "Document",
-                    "href": f"{self.portal_base_url}/event/{event_id}/files/agenda/{file_id}",  # noqa
+                    "href": f"{file_prefix}{file_id}",
                 }
             )
         return links
@@ -234,11 +361,4 @@ class CivicClerkMixin(CityScrapersSpider):
         """Parse an ISO datetime string into a naive datetime object."""
         if not dt_str:
             return None
-        # Handle ISO format like '2025-11-19T11:30:00Z'
-        dt_str = dt_str.replace("Z", "+00:00")
-        try:
-            dt = datetime.fromisoformat(dt_str)
-            # Return naive datetime (strip timezone)
-            return dt.replace(tzinfo=None)
-        except ValueError:
-            return None
+        return _parse_dt(dt_str)
@@ -1,5 +1,4 @@
 import calendar
-import html
 import json
 import re
 from datetime import datetime
@@ -7,11 +6,12 @@ from datetime import datetime
 import scrapy
 from city_scrapers_core.constants import BOARD, COMMITTEE, NOT_CLASSIFIED
 from city_scrapers_core.items import Meeting
-from city_scrapers_core.spiders import CityScrapersSpider
 from curl_cffi import requests as curl_requests
 
+from city_scrapers.mixins.simbli import SimbliMixin
 
-class KancitBoardOfDirectorsSpider(CityScrapersSpider):
+
+class KancitBoardOfDirectorsSpider(SimbliMixin):
     name = "kancit_board_of_directors"
     agency = "Kansas City Board of Directors"
     timezone = "America/Chicago"
@@ -22,10 +22,10 @@ class KancitBoardOfDirectorsSpider(CityScrapersSpider):
     }
 
     # Simbli eBoard scraping (main source)
+    school_id = "228"
     main_url = (
         "https://simbli.eboardsolutions.com/SB_Meetings/SB_MeetingListing.aspx?S=228"
     )
-    api_url = "https://simbli.eboardsolutions.com/Services/api/GetMeetingListing"
     # KCPS calendar scraping (only for upcoming meetings for School Board and all DACs)
     calendar_api_url = (
         "https://thrillshare-cmsv2.services.thrillshare.com/api/v4/o/30884/cms/events"
@@ -35,6 +35,48 @@ class KancitBoardOfDirectorsSpider(CityScrapersSpider):
     )
     calendar_filter_names = {"School Board", "District Advisory Committee (DAC)"}
 
+    # Board of Education (2901 Troost) — versions
+    TROOST_VARIATIONS = [
+        "2901 troost ave",
+        "2901 troost avenue",
+        "2901 troost",
+        "board auditorium",
+        "board of education building",
+        "board of education",
+        "board room",
+        "kcps board of education building",
+        "delano",
+    ]
+
+    # Virtual / Remote Meetings
+    VIRTUAL_KEYWORDS = [
+        "conference call",
+        "videoconference",
+        "video conference",
+        "teleconference",
+        "via teleconference",
+        "livestream",
+        "live stream",
+        "via zoom",
+        "virtual",
+        "live at",
+        "kcpublicschools.org/live",
+        "816.418.1113",
+        "816-418-1113",
+        "zoom",
+    ]
+
+    TEAMS_KEYWORDS = [
+        "teams",
+        "msteams",
+    ]
+
+    # Compiled alternations so each location check is a single C-level
+    # regex scan instead of a Python loop over substrings
+    TROOST_RE = re.compile("|".join(re.escape(k) for k in TROOST_VARIATIONS))
+    VIRTUAL_RE = re.compile("|".join(re.escape(k) for k in VIRTUAL_KEYWORDS))
+    TEAMS_RE = re.compile("|".join(re.escape(k) for k in TEAMS_KEYWORDS))
+
     # Set to track upcoming meeting dates from Simbli to avoid duplicates with calendar meetings # noqa
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -184,67 +226,6 @@ class KancitBoardOfDirectorsSpider(CityScrapersSpider):
             return self.calendar_base_url
         return f"{self.calendar_base_url}&id={event_id}"
 
-    def _extract_token(self, html, patterns):
-        """Extract token from HTML using regex patterns"""
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if match:
-                return match.group(1)
-
-        return None
-
-    def _fetch_meetings_page(self, record_start, connection_string, security_token):
-        """
-        Fetch a page of meetings via API.
-        Sends a POST request to Simbli API.
-        Handles pagination (50 meetings per page).
-        Includes required connection tokens in payload.
-        """
-        payload = {
-            "ListingType": "0",
-            "TimeZone": "-60",
-            "CustomSort": 0,
-            "SortColName": "DateTime",
-            "IsSortDesc": True,
-            "RecordStart": record_start,
-            "RecordCount": 50,
-            "FilterExp": "",
-            "ParentGroup": None,
-            "IsUserLoggedIn": False,
-            "UserID": "",
-            "UserRole": None,
-            "EncUserId": None,
-            "Id": 0,
-            "SchoolID": "228",
-            "ConnectionString": connection_string,
-            "SecurityToken": security_token,
-            "CreatedOn": "0001-01-01T00:00:00",
-            "CreatedBy": None,
-            "ModifiedOn": "0001-01-01T00:00:00",
-            "ModifiedBy": None,
-            "DeletedBy": None,
-            "DeletedOnUTC": None,
-            "IsDeleted": False,
-        }
-
-        yield scrapy.Request(
-            url=self.api_url,
-            method="POST",
-            headers={
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/json",
-                "X-Requested-With": "XMLHttpRequest",
-                "Referer": self.main_url,
-            },
-            body=json.dumps(payload),
-            callback=self.parse_api_response,
-            meta={
-                "record_start": record_start,
-                "connection_string": connection_string,
-                "security_token": security_token,
-            },
-        )
-
     def parse_api_response(self, response):
         """
         Parse JSON API response and continue pagination
@@ -325,28 +306,6 @@ class KancitBoardOfDirectorsSpider(CityScrapersSpider):
 
         return meeting
 
-    def _normalize_title(self, title):
-        """Remove date patterns and clean up meeting titles"""
-        # Decode HTML entities
-        title = html.unescape(title)
-
-        # Remove date patterns
-        date_patterns = [
-            r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\s+",  # noqa
-            r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+",  # noqa
-            r"\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+",  # noqa
-        ]
-
-        for pattern in date_patterns:
-            title = re.sub(pattern, "", title, flags=re.IGNORECASE)
-
-        # Remove parentheses around cancelled/rescheduled
-        title = re.sub(
-            r"\(\s*(cancel\w+|rescheduled)\s*\)", r"\1", title, flags=re.IGNORECASE
-        )
-
-        return " ".join(title.split()).strip()
-
     def _classify_meeting(self, title):
         """Classify meeting based on title keywords"""
         title_lower = title.lower()
@@ -398,45 +357,9 @@ class KancitBoardOfDirectorsSpider(CityScrapersSpider):
 
         BOARD_ADDRESS = "2901 Troost Ave, Kansas City, MO 64109"
 
-        # Board of Education (2901 Troost) — versions
-        TROOST_VARIATIONS = [
-            "2901 troost ave",
-            "2901 troost avenue",
-            "2901 troost",
-            "board auditorium",
-            "board of education building",
-            "board of education",
-            "board room",
-            "kcps board of education building",
-            "delano",
-        ]
-
-        # Virtual / Remote Meetings
-        VIRTUAL_KEYWORDS = [
-            "conference call",
-            "videoconference",
-            "video conference",
-            "teleconference",
-            "via teleconference",
-            "livestream",
-            "live stream",
-            "via zoom",
-            "virtual",
-            "live at",
-            "kcpublicschools.org/live",
-            "816.418.1113",
-            "816-418-1113",
-            "zoom",
-        ]
-
-        TEAMS_KEYWORDS = [
-            "teams",
-            "msteams",
-        ]
-
-        is_board_troost_variation = any(v in full_text for v in TROOST_VARIATIONS)
-        is_virtual = any(keyword in full_text for keyword in VIRTUAL_KEYWORDS)
-        is_teams = any(keyword in full_text for keyword in TEAMS_KEYWORDS)
+        is_board_troost_variation = self.TROOST_RE.search(full_text) is not None
+        is_virtual = self.VIRTUAL_RE.search(full_text) is not None
+        is_teams = self.TEAMS_RE.search(full_text) is not None
 
         # HYBRID (Board of Education + Virtual)
         if is_board_troost_variation and is_virtual:
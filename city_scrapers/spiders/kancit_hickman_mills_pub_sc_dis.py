@@ -1,4 +1,3 @@
-import html
 import json
 import re
 from datetime import datetime
@@ -6,11 +5,12 @@ from datetime import datetime
 import scrapy
 from city_scrapers_core.constants import BOARD, COMMITTEE, NOT_CLASSIFIED
 from city_scrapers_core.items import Meeting
-from city_scrapers_core.spiders import CityScrapersSpider
 from dateutil.relativedelta import relativedelta
 
+from city_scrapers.mixins.simbli import SimbliMixin
 
-class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
+
+class KancitHickmanMillsPubScDisSpider(SimbliMixin):
     name = "kancit_hickman_mills_pub_sc_dis"
     agency = "Hickman Mills C-1 Public School District"
     timezone = "America/Chicago"
@@ -31,12 +31,36 @@ class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
     main_url = (
         "https://simbli.eboardsolutions.com/SB_Meetings/SB_MeetingListing.aspx?S=223"
     )
-    api_url = "https://simbli.eboardsolutions.com/Services/api/GetMeetingListing"
 
     # Hickman Mills calendar
     calendar_base_url = "https://www.hickmanmills.org/calendar"
     calendar_url = "https://www.hickmanmills.org/fs/elements/9768"
 
+    RWLC_VARIATIONS = [
+        "real world learning center",
+        "hickman mills administrative center",
+        "open session board room",
+        "10301 hickman mills dr",
+    ]
+    VIRTUAL_KEYWORDS = [
+        "conference call",
+        "videoconference",
+        "video conference",
+        "teleconference",
+        "via teleconference",
+        "livestream",
+        "live stream",
+        "via zoom",
+        "virtual",
+        "live at",
+        "zoom.us",
+    ]
+
+    # Compiled alternations so each location check is a single C-level
+    # regex scan instead of a Python loop over substrings
+    RWLC_RE = re.compile("|".join(re.escape(k) for k in RWLC_VARIATIONS))
+    VIRTUAL_RE = re.compile("|".join(re.escape(k) for k in VIRTUAL_KEYWORDS))
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.simbli_upcoming_dates = set()
@@ -136,62 +160,6 @@ class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
 
         yield from self._fetch_meetings_page(0, connection_string, security_token)
 
-    def _extract_token(self, html, patterns):
-        """Extract token from HTML using regex patterns."""
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if match:
-                return match.group(1)
-        return None
-
-    def _fetch_meetings_page(self, record_start, connection_string, security_token):
-        """POST to Simbli GetMeetingListing with pagination."""
-        payload = {
-            "ListingType": "0",
-            "TimeZone": "-60",
-            "CustomSort": 0,
-            "SortColName": "DateTime",
-            "IsSortDesc": True,
-            "RecordStart": record_start,
-            "RecordCount": 50,
-            "FilterExp": "",
-            "ParentGroup": None,
-            "IsUserLoggedIn": False,
-            "UserID": "",
-            "UserRole": None,
-            "EncUserId": None,
-            "Id": 0,
-            "SchoolID": self.school_id,
-            "ConnectionString": connection_string,
-            "SecurityToken": security_token,
-            "CreatedOn": "0001-01-01T00:00:00",
-            "CreatedBy": None,
-            "ModifiedOn": "0001-01-01T00:00:00",
-            "ModifiedBy": None,
-            "DeletedBy": None,
-            "DeletedOnUTC": None,
-            "IsDeleted": False,
-        }
-
-        yield scrapy.Request(
-            url=self.api_url,
-            method="POST",
-            headers={
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/json",
-                "X-Requested-With": "XMLHttpRequest",
-                "Referer": self.main_url,
-            },
-            body=json.dumps(payload),
-            callback=self.parse_api_response,
-            meta={
-                "record_start": record_start,
-                "connection_string": connection_string,
-                "security_token": security_token,
-            },
-            dont_filter=True,
-        )
-
     def parse_api_response(self, response):
         try:
             data = json.loads(response.text)
@@ -332,28 +300,9 @@ class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
         )
 
         HICKMAN_MILLS_ADDRESS = "10301 Hickman Mills Dr., Kansas City, MO 64137"
-        RWLC_VARIATIONS = [
-            "real world learning center",
-            "hickman mills administrative center",
-            "open session board room",
-            "10301 hickman mills dr",
-        ]
-        VIRTUAL_KEYWORDS = [
-            "conference call",
-            "videoconference",
-            "video conference",
-            "teleconference",
-            "via teleconference",
-            "livestream",
-            "live stream",
-            "via zoom",
-            "virtual",
-            "live at",
-            "zoom.us",
-        ]
 
-        is_rwlc = any(v in full_text for v in RWLC_VARIATIONS)
-        is_virtual = any(keyword in full_text for keyword in VIRTUAL_KEYWORDS)
+        is_rwlc = self.RWLC_RE.search(full_text) is not None
+        is_virtual = self.VIRTUAL_RE.search(full_text) is not None
 
         if is_rwlc and is_virtual:
             return {
@@ -375,9 +324,7 @@ class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
         location_address = " ".join(filter(None, [address2, address3])).strip()
 
         # If address contains RWLC keywords, canonicalize it
-        if location_address and any(
-            v in location_address.lower() for v in RWLC_VARIATIONS
-        ):
+        if location_address and self.RWLC_RE.search(location_address.lower()):
             location_address = HICKMAN_MILLS_ADDRESS
 
         return {
@@ -539,25 +486,6 @@ class KancitHickmanMillsPubScDisSpider(CityScrapersSpider):
         except ValueError:
             return None
 
-    def _normalize_title(self, title):
-        title = html.unescape(title)
-
-        date_patterns = [
-            r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\s+",  # noqa
-            r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+",  # noqa
-            r"\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+",  # noqa
-        ]
-
-        for pattern in date_patterns:
-            title = re.sub(pattern, "", title, flags=re.IGNORECASE)
-
-        # Remove parentheses around cancelled/rescheduled
-        title = re.sub(
-            r"\(\s*(cancel\w+|rescheduled)\s*\)", r"\1", title, flags=re.IGNORECASE
-        )
-
-        return " ".join(title.split()).strip()
-
     def _create_calendar_meeting(self, title, start, location, links, source):
         """Create a Meeting object for calendar meetings"""
         meeting = Meeting(
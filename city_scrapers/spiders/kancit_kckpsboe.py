@@ -1,5 +1,7 @@
 import re
-from datetime import date, datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urlencode
 
 import scrapy
@@ -8,6 +10,18 @@ from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
 
 
+@lru_cache(maxsize=256)
+def _classify_title(raw_title):
+    """
+    Classify a raw title string. Pure function of the title, and the same
+    recurring titles repeat across the multi-year feed, so repeats skip
+    the lowercase copy and substring scan entirely.
+    """
+    if "committee" in raw_title.lower():
+        return COMMITTEE
+    return BOARD
+
+
 class KancitKckpsBoeSpider(CityScrapersSpider):
     name = "kancit_kckps_boe"
     agency = "Kansas City Kansas Public Schools Board of Education"
@@ -31,7 +45,7 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
             "from": from_date,
             "to": to_date,
             "loadall": "false",
-            "_": int(datetime.now(timezone.utc).timestamp() * 1000),  # cache buster
+            "_": int(time.time() * 1000),  # cache buster
         }
         url = f"{self.meetings_api_url}?{urlencode(params)}"
         yield scrapy.Request(url=url, callback=self.parse)
@@ -49,15 +63,18 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
 
     def _create_meeting(self, item):
         """Create a Meeting item with parsed data."""
+        # The raw title feeds four of the parse helpers; read and strip it
+        # once per item instead of once per helper
+        raw_title = self._get_raw_title(item)
         meeting = Meeting(
-            title=self._parse_title(item),
+            title=self._parse_title(raw_title),
             description="",
-            classification=self._parse_classification(item),
-            start=self._parse_start(item),
+            classification=self._parse_classification(raw_title),
+            start=self._parse_start(item, raw_title),
             end=None,
             all_day=False,
-            time_notes=self._parse_time_notes(item),
-            location=self._parse_location(item),
+            time_notes=self._parse_time_notes(raw_title),
+            location=self._parse_location(item, raw_title),
             links=self._parse_links(item),
             source=self.source_url,
         )
@@ -71,13 +88,12 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
         """Get the raw meeting title from item."""
         return item.get("Name", "").strip() or item.get("MeetingTypeName", "").strip()
 
-    def _parse_title(self, item):
+    def _parse_title(self, raw_title):
         """Parse or generate meeting title."""
-        title = self._get_raw_title(item)
+        title = raw_title
 
         # Remove time information first
-        for pattern in self.TIME_PATTERNS:
-            title = pattern.sub("", title)
+        title = self.TIME_PATTERN.sub("", title)
 
         title = title.replace(" - Current", "")
 
@@ -89,20 +105,14 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
             title = parts[0].strip()
 
         # Pattern 2: Remove specific date patterns
-        for pattern in self.DATE_PATTERNS:
-            title = pattern.sub("", title)
+        title = self.DATE_PATTERN.sub("", title)
 
         # Normalize whitespace
         return self.WHITESPACE_PATTERN.sub(" ", title).strip()
 
-    def _parse_classification(self, item):
+    def _parse_classification(self, raw_title):
         """Parse or generate classification from allowed options."""
-        meeting_title = self._get_raw_title(item)
-
-        # Check both title and meeting type for classification
-        if "committee" in meeting_title.lower():
-            return COMMITTEE
-        return BOARD
+        return _classify_title(raw_title)
 
     # Default start times (hour) for meetings when API returns midnight
     MIDNIGHT_DEFAULTS = {
@@ -121,87 +131,55 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
         ],
     }
 
-    TIME_PATTERNS = [
-        re.compile(r"\s+at\s+\d{1,2}:\d{2}\s*(?:a\.?m\.?|p\.?m\.?)"),  # "at 4:00 PM"
-        re.compile(r"\s+\d{1,2}:\d{2}\s*(?:a\.?m\.?|p\.?m\.?)"),  # "4:00 PM"
-        re.compile(r"\s+\d{1,2}\s*(?:a\.?m\.?|p\.?m\.?)"),  # "9 AM"
-    ]
-
-    DATE_PATTERNS = [
-        re.compile(
-            r"\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}$"  # noqa
-        ),  # "April 17, 2025"
-        re.compile(r"\s+\d{1,2}/\d{1,2}/\d{4}$"),  # "02/21/2025"
-        re.compile(r"\s+\d{4}$"),  # "2025" at end
-        re.compile(r"\s+\d{1,2},\s+\d{4}$"),  # "21, 2025"
-    ]
+    # Single alternations so each title is scanned once per group rather
+    # than once per pattern
+    TIME_PATTERN = re.compile(
+        r"\s+at\s+\d{1,2}:\d{2}\s*(?:a\.?m\.?|p\.?m\.?)"  # "at 4:00 PM"
+        r"|\s+\d{1,2}:\d{2}\s*(?:a\.?m\.?|p\.?m\.?)"  # "4:00 PM"
+        r"|\s+\d{1,2}\s*(?:a\.?m\.?|p\.?m\.?)"  # "9 AM"
+    )
+
+    DATE_PATTERN = re.compile(
+        r"\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}$"  # noqa  # "April 17, 2025"
+        r"|\s+\d{1,2}/\d{1,2}/\d{4}$"  # "02/21/2025"
+        r"|\s+\d{4}$"  # "2025" at end
+        r"|\s+\d{1,2},\s+\d{4}$"  # "21, 2025"
+    )
 
     WHITESPACE_PATTERN = re.compile(r"\s+")
 
+    # Titles whose meetings also offer a virtual option; one alternation
+    # scan instead of two substring checks per item
+    VIRTUAL_TITLE_PATTERN = re.compile(
+        r"Finance Committee Meeting|Special Meeting Agenda"
+    )
+
     # Location constants
     CENTRAL_OFFICE = "Kansas Public Schools"
     ADDRESS = "2010 N. 59th Street, Kansas City, Kansas 66103"
     BOARD_ROOM = f"{CENTRAL_OFFICE} - Third Floor Board Room"
     EAST_WING = f"{CENTRAL_OFFICE} - Third Floor East Wing"
 
-    LOCATION_MAP = [
-        {
-            "keyword": "Board Retreat",
-            "extra": None,
-            "address": "10 E Cambridge Circle Drive #300, Kansas City, Kansas 66103",
-            "name": "McAnany Van Cleave & Phillips Law Firm",
-        },
-        {
-            "keyword": "Academic Committee Meeting",
-            "extra": None,
-            "address": ADDRESS,
-            "name": CENTRAL_OFFICE,
-        },
-        {
-            "keyword": "Finance Committee Meeting",
-            "extra": None,
-            "address": "",
-            "name": "Kansas City, Kansas Public Schools",
-        },
-        {
-            "keyword": "Facilities",
-            "extra": "Committee Meeting",
-            "address": ADDRESS,
-            "name": EAST_WING,
-        },
-        {
-            "keyword": "Boundary",
-            "extra": "Committee Meeting",
-            "address": ADDRESS,
-            "name": EAST_WING,
-        },
-        {
-            "keyword": "Special Board Meeting Agenda",
-            "extra": None,
-            "address": ADDRESS,
-            "name": BOARD_ROOM,
-        },
-        {
-            "keyword": "Special",
-            "extra": None,
-            "address": ADDRESS,
-            "name": CENTRAL_OFFICE,
-        },
-        {
-            "keyword": "Regular Board Meeting Agenda",
-            "extra": None,
-            "address": ADDRESS,
-            "name": BOARD_ROOM,
-        },
-        {
-            "keyword": "Regular Meeting Agenda",
-            "extra": None,
-            "address": ADDRESS,
-            "name": BOARD_ROOM,
-        },
-    ]
-
-    def _parse_start(self, item):
+    # (keyword, extra, address, name) rows, scanned in order; first row
+    # whose keyword (and extra, when set) appears in the title wins
+    LOCATION_MAP = (
+        (
+            "Board Retreat",
+            None,
+            "10 E Cambridge Circle Drive #300, Kansas City, Kansas 66103",
+            "McAnany Van Cleave & Phillips Law Firm",
+        ),
+        ("Academic Committee Meeting", None, ADDRESS, CENTRAL_OFFICE),
+        ("Finance Committee Meeting", None, "", "Kansas City, Kansas Public Schools"),
+        ("Facilities", "Committee Meeting", ADDRESS, EAST_WING),
+        ("Boundary", "Committee Meeting", ADDRESS, EAST_WING),
+        ("Special Board Meeting Agenda", None, ADDRESS, BOARD_ROOM),
+        ("Special", None, ADDRESS, CENTRAL_OFFICE),
+        ("Regular Board Meeting Agenda", None, ADDRESS, BOARD_ROOM),
+        ("Regular Meeting Agenda", None, ADDRESS, BOARD_ROOM),
+    )
+
+    def _parse_start(self, item, meeting_title):
         """Parse start datetime as a naive datetime object."""
         datetime_str = item.get("MeetingDateTime", "")
         if not datetime_str:
@@ -211,7 +189,6 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
 
         # Apply default time if API returns midnight
         if start_datetime.hour == 0 and start_datetime.minute == 0:
-            meeting_title = self._get_raw_title(item)
             for hour, keywords in self.MIDNIGHT_DEFAULTS.items():
                 if any(keyword in meeting_title for keyword in keywords):
                     start_datetime = start_datetime.replace(hour=hour, minute=0)
@@ -219,31 +196,24 @@ class KancitKckpsBoeSpider(CityScrapersSpider):
 
         return start_datetime
 
-    def _parse_time_notes(self, item):
+    def _parse_time_notes(self, meeting_title):
         """Parse any additional notes on the timing of the meeting"""
-        meeting_title = self._get_raw_title(item)
-
         notes = ["Please check meeting attachments for accurate time and location."]
 
         # Add virtual meeting note for Finance Committee meetings and Special meetings
-        if (
-            "Finance Committee Meeting" in meeting_title
-            or "Special Meeting Agenda" in meeting_title
-        ):
+        if self.VIRTUAL_TITLE_PATTERN.search(meeting_title):
             notes.append(
                 "You are invited to join virtually. Please check the attachments for the virtual link."  # noqa
             )
 
         return " ".join(notes)
 
-    def _parse_location(self, item):
+    def _parse_location(self, item, meeting_title):
         """Parse or generate location."""
-        meeting_title = self._get_raw_title(item)
-
-        for loc in self.LOCATION_MAP:
-            if loc["keyword"] in meeting_title:
-                if loc["extra"] is None or loc["extra"] in meeting_title:
-                    return {"address": loc["address"], "name": loc["name"]}
+        for keyword, extra, address, name in self.LOCATION_MAP:
+            if keyword in meeting_title:
+                if extra is None or extra in meeting_title:
+                    return {"address": address, "name": name}
 
         return {"address": "", "name": item.get("MeetingLocation", "")}
 
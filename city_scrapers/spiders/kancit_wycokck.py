@@ -1,10 +1,14 @@
+from city_scrapers_core.constants import COMMITTEE
+
 from city_scrapers.mixins.wycokck import CivicClerkMixin
 
 # Common agency suffix
 AGENCY_SUFFIX = " - Unified Government of Wyandotte County and Kansas City"
 
 # Configuration for each spider
-# Classification is derived from meeting title in the mixin's _parse_classification
+# Classification comes from category_classification when the category maps
+# to a single body; otherwise it is derived from the meeting title in the
+# mixin's _parse_classification
 spider_configs = [
     # Board of Commissioners (categories 31, 33, 35, 36, 37)
     {
@@ -28,6 +32,7 @@ spider_configs = [
         "agency": "Neighborhood & Community Development Standing Committee"
         + AGENCY_SUFFIX,
         "category_ids": [27],
+        "category_classification": {27: COMMITTEE},
     },
     # Category 28: Economic Development & Finance Standing Committee
     {
@@ -35,6 +40,7 @@ spider_configs = [
         "name": "kancit_economic_dev",
         "agency": "Economic Development & Finance Standing Committee" + AGENCY_SUFFIX,
         "category_ids": [28],
+        "category_classification": {28: COMMITTEE},
     },
     # Category 29: Public Works & Safety Standing Committee
     {
@@ -42,6 +48,7 @@ spider_configs = [
         "name": "kancit_public_works",
         "agency": "Public Works & Safety Standing Committee" + AGENCY_SUFFIX,
         "category_ids": [29],
+        "category_classification": {29: COMMITTEE},
     },
     # Category 30: Administration & Human Services Standing Committee
     {
@@ -49,6 +56,7 @@ spider_configs = [
         "name": "kancit_admin_human_services",
         "agency": "Administration & Human Services Standing Committee" + AGENCY_SUFFIX,
         "category_ids": [30],
+        "category_classification": {30: COMMITTEE},
     },
     # Category 34: Committee/Task Force
     {
@@ -56,6 +64,7 @@ spider_configs = [
         "name": "kancit_task_force",
         "agency": "Committee/Task Force" + AGENCY_SUFFIX,
         "category_ids": [34],
+        "category_classification": {34: COMMITTEE},
     },
 ]
 
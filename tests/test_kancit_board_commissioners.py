@@ -8,85 +8,105 @@ from freezegun import freeze_time
 
 from city_scrapers.spiders.kancit_wycokck import KancitBoardCommissionersSpider
 
-# Load local JSON file for testing
-test_response = file_response(
-    join(dirname(__file__), "files", "kancit_board_commissioners.json"),
-    url="https://wycokck.api.civicclerk.com/v1/Events?$filter=categoryId+in+(31,33,35,36,37)",  # noqa
-)
-
-spider = KancitBoardCommissionersSpider()
-
-# Freeze time for consistent test results
-freezer = freeze_time("2026-01-20")
-freezer.start()
 
-parsed_items = [item for item in spider.parse(test_response)]
-
-freezer.stop()
+@pytest.fixture(scope="module")
+@freeze_time("2026-01-20")
+def parsed_items():
+    """Parse the fixture once per module instead of at import time."""
+    test_response = file_response(
+        join(dirname(__file__), "files", "kancit_board_commissioners.json"),
+        url="https://wycokck.api.civicclerk.com/v1/Events?$filter=categoryId+in+(31,33,35,36,37)",  # noqa
+    )
+    spider = KancitBoardCommissionersSpider()
+    return [item for item in spider.parse(test_response)]
 
 
-def test_count():
+def test_count(parsed_items):
     """Test that all events are parsed."""
     assert len(parsed_items) == 7
 
 
-def test_title():
+@pytest.mark.parametrize(
+    "idx,expected",
+    [
+        (0, "Full Commission"),
+        (1, "Board of Commissioners"),
+        (2, "Planning & Zoning and Board of Commission"),
+        (3, "Board of Commissioners Special Meeting"),
+        # Test leading date removal (8.15.24, 10.12.23, 8/10/23)
+        (4, "Board of Commission Special Meeting"),
+        (5, "Full Commission Special Session"),
+        (6, "Full Commission Special Session"),
+    ],
+)
+def test_title(parsed_items, idx, expected):
     """Test that titles are correctly parsed."""
-    assert parsed_items[0]["title"] == "Full Commission"
-    assert parsed_items[1]["title"] == "Board of Commissioners"
-    assert parsed_items[2]["title"] == "Planning & Zoning and Board of Commission"
-    assert parsed_items[3]["title"] == "Board of Commissioners Special Meeting"
-    # Test leading date removal (8.15.24, 10.12.23, 8/10/23)
-    assert parsed_items[4]["title"] == "Board of Commission Special Meeting"
-    assert parsed_items[5]["title"] == "Full Commission Special Session"
-    assert parsed_items[6]["title"] == "Full Commission Special Session"
+    assert parsed_items[idx]["title"] == expected
 
 
-def test_description():
+def test_description(parsed_items):
     """Test that descriptions are correctly parsed."""
     assert parsed_items[0]["description"] == "Regular monthly meeting"
     assert parsed_items[1]["description"] == ""
     assert parsed_items[3]["description"] == "Special budget meeting"
 
 
-def test_start():
+@pytest.mark.parametrize(
+    "idx,expected",
+    [
+        (0, datetime(2026, 1, 15, 17, 30)),
+        (1, datetime(2026, 2, 19, 17, 30)),
+        (2, datetime(2025, 12, 18, 17, 30)),
+        (3, datetime(2026, 1, 22, 14, 0)),
+    ],
+)
+def test_start(parsed_items, idx, expected):
     """Test that start times are correctly parsed."""
-    assert parsed_items[0]["start"] == datetime(2026, 1, 15, 17, 30)
-    assert parsed_items[1]["start"] == datetime(2026, 2, 19, 17, 30)
-    assert parsed_items[2]["start"] == datetime(2025, 12, 18, 17, 30)
-    assert parsed_items[3]["start"] == datetime(2026, 1, 22, 14, 0)
+    assert parsed_items[idx]["start"] == expected
 
 
-def test_end():
+@pytest.mark.parametrize(
+    "idx,expected",
+    [
+        (0, datetime(2026, 1, 15, 19, 30)),
+        (1, None),
+        (2, datetime(2025, 12, 18, 19, 0)),
+        (3, datetime(2026, 1, 22, 16, 0)),
+    ],
+)
+def test_end(parsed_items, idx, expected):
     """Test that end times are correctly parsed."""
-    assert parsed_items[0]["end"] == datetime(2026, 1, 15, 19, 30)
-    assert parsed_items[1]["end"] is None
-    assert parsed_items[2]["end"] == datetime(2025, 12, 18, 19, 0)
-    assert parsed_items[3]["end"] == datetime(2026, 1, 22, 16, 0)
+    assert parsed_items[idx]["end"] == expected
 
 
-def test_time_notes():
+def test_time_notes(parsed_items):
     """Test that time notes are empty as expected."""
     for item in parsed_items:
         assert item["time_notes"] == ""
 
 
-def test_id():
+def test_id(parsed_items):
     """Test that IDs are generated correctly."""
     assert parsed_items[0]["id"] is not None
     assert "kancit_board_commissioners" in parsed_items[0]["id"]
 
 
-def test_status():
+# With freeze_time at 2026-01-20:
+@pytest.mark.parametrize(
+    "idx,expected",
+    [
+        (0, PASSED),  # 2026-01-15
+        (1, TENTATIVE),  # 2026-02-19
+        (2, PASSED),  # 2025-12-18
+        (3, TENTATIVE),  # 2026-01-22
+    ],
+)
+def test_status(parsed_items, idx, expected):
     """Test that status is correctly determined."""
-    # With freeze_time at 2026-01-20:
-    assert parsed_items[0]["status"] == PASSED  # 2026-01-15
-    assert parsed_items[1]["status"] == TENTATIVE  # 2026-02-19
-    assert parsed_items[2]["status"] == PASSED  # 2025-12-18
-    assert parsed_items[3]["status"] == TENTATIVE  # 2026-01-22
+    assert parsed_items[idx]["status"] == expected
 
 
-def test_location_with_address():
+def test_location_with_address(parsed_items):
     """Test that location with address is correctly parsed."""
     assert parsed_items[0]["location"] == {
         "name": "Unified Government of Wyandotte County/Kansas City",
@@ -94,7 +114,7 @@ def test_location_with_address():
     }
 
 
-def test_location_without_address():
+def test_location_without_address(parsed_items):
     """Test that location without address uses default."""
     assert parsed_items[1]["location"] == {
         "name": "Unified Government of Wyandotte County/Kansas City",
@@ -102,7 +122,7 @@ def test_location_without_address():
     }
 
 
-def test_source():
+def test_source(parsed_items):
     """Test that source URLs are correctly generated."""
     assert (
         parsed_items[0]["source"] == "https://wycokck.portal.civicclerk.com/event/3001"
@@ -112,7 +132,7 @@ def test_source():
     )
 
 
-def test_links():
+def test_links(parsed_items):
     """Test that links are correctly parsed."""
     # First item has one link
     assert len(parsed_items[0]["links"]) == 1
@@ -132,19 +152,14 @@ def test_links():
     assert "Minutes" in link_titles
 
 
-def test_classification():
+# Every title contains "commission" -> COMMISSION
+@pytest.mark.parametrize("idx", [0, 1, 2, 3])
+def test_classification(parsed_items, idx):
     """Test that classification is determined from title."""
-    # "Full Commission" contains "commission" -> COMMISSION
-    assert parsed_items[0]["classification"] == COMMISSION
-    # "Board of Commissioners" contains "commission" -> COMMISSION
-    assert parsed_items[1]["classification"] == COMMISSION
-    # "Planning & Zoning and Board of Commission" contains "commission" -> COMMISSION
-    assert parsed_items[2]["classification"] == COMMISSION
-    # "Board of Commissioners Special Meeting" contains "commission" -> COMMISSION
-    assert parsed_items[3]["classification"] == COMMISSION
-
-
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
+    assert parsed_items[idx]["classification"] == COMMISSION
+
+
+def test_all_day(parsed_items):
     """Test that all_day is False for all items."""
-    assert item["all_day"] is False
+    for item in parsed_items:
+        assert item["all_day"] is False
@@ -1,75 +1,67 @@
-import json
 from datetime import datetime
 from os.path import dirname, join
 
+import orjson
 import pytest
+import time_machine
 from city_scrapers_core.constants import CITY_COUNCIL, PASSED
-from freezegun import freeze_time
 
 from city_scrapers.spiders import kancit_missouricity
 
 KancitCouncilSpider = kancit_missouricity.KancitSpider034
 
-with open(join(dirname(__file__), "files", "kancit_council.json"), "r") as f:
-    test_response = json.load(f)
 
-spider = KancitCouncilSpider()
+@pytest.fixture(scope="module")
+@time_machine.travel("2026-03-01", tick=False)
+def parsed_items():
+    """Parse the fixture once per module instead of at import time."""
+    with open(join(dirname(__file__), "files", "kancit_council.json"), "rb") as f:
+        test_response = orjson.loads(f.read())
 
-freezer = freeze_time("2026-03-01")
-freezer.start()
+    spider = KancitCouncilSpider()
+    return list(spider.parse_legistar(test_response))
 
-parsed_items = list(spider.parse_legistar(test_response))
 
-freezer.stop()
-
-
-def test_count():
+def test_count(parsed_items):
     assert len(parsed_items) == 3
 
 
-def test_title():
-    assert parsed_items[0]["title"] == "Council"
-
-
-def test_description():
-    assert parsed_items[0]["description"] == (
-        "Council meetings are also held virtually. Please check the meeting attachment for details on how to attend."  # noqa
-    )
-
-
-def test_start():
-    assert parsed_items[0]["start"] == datetime(2026, 1, 16, 9, 0)
-
+# Single-field expectations for the first parsed item; one parametrized
+# test replaces the block of one-assert functions while still reporting
+# each field separately
+FIELD_CASES = [
+    ("title", "Council"),
+    (
+        "description",
+        "Council meetings are also held virtually. Please check the meeting attachment for details on how to attend.",  # noqa
+    ),
+    ("start", datetime(2026, 1, 16, 9, 0)),
+    ("end", None),
+    ("time_notes", ""),
+    ("id", "kancit_034/202601160900/x/council"),
+    ("status", PASSED),
+    ("classification", CITY_COUNCIL),
+]
 
-def test_end():
-    assert parsed_items[0]["end"] is None
 
+@pytest.mark.parametrize("field,expected", FIELD_CASES)
+def test_field(parsed_items, field, expected):
+    assert parsed_items[0][field] == expected
 
-def test_time_notes():
-    assert parsed_items[0]["time_notes"] == ""
 
-
-def test_id():
-    assert parsed_items[0]["id"] == "kancit_034/202601160900/x/council"
-
-
-def test_status():
-    assert parsed_items[0]["status"] == PASSED
-
-
-def test_location():
+def test_location(parsed_items):
     assert (
         parsed_items[0]["location"]["address"] == "414 E 12th St, Kansas City, MO 64106"
     )
 
 
-def test_source():
+def test_source(parsed_items):
     assert (
         parsed_items[0]["source"] == "https://clerk.kcmo.gov/MeetingDetail.aspx?ID=1001"
     )
 
 
-def test_links():
+def test_links(parsed_items):
     assert parsed_items[0]["links"] == [
         {
             "href": "https://clerk.kcmo.gov/View.ashx?M=A&ID=1001",
@@ -82,10 +74,6 @@ def test_links():
     ]
 
 
-def test_classification():
-    assert parsed_items[0]["classification"] == CITY_COUNCIL
-
-
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
-    assert item["all_day"] is False
+def test_all_day(parsed_items):
+    for item in parsed_items:
+        assert item["all_day"] is False